@@ -6,14 +6,7 @@ import "./BaseTest.sol";
 contract SetIsDepositLimitFailureTests is BaseTest {
 
     function test_setIsDepositLimit_notRole() public {
-        bytes32 depositLimitSetRole = keccak256("IS_DEPOSIT_LIMIT_SET_ROLE");
-        vm.expectRevert(
-            abi.encodeWithSignature(
-                "AccessControlUnauthorizedAccount(address,bytes32)",
-                alice,
-                depositLimitSetRole
-            )
-        );
+        vm.expectRevert(_accessControlUnauthorizedError(alice, IS_DEPOSIT_LIMIT_SET_ROLE));
         vm.prank(alice);
         stSpk.setIsDepositLimit(true);
     }
@@ -52,14 +45,7 @@ contract SetIsDepositLimitSuccessTests is BaseTest {
 contract SetDepositLimitFailureTests is BaseTest {
 
     function test_setDepositLimit_notRole() public {
-        bytes32 depositLimitSetRole = keccak256("DEPOSIT_LIMIT_SET_ROLE");
-        vm.expectRevert(
-            abi.encodeWithSignature(
-                "AccessControlUnauthorizedAccount(address,bytes32)",
-                alice,
-                depositLimitSetRole
-            )
-        );
+        vm.expectRevert(_accessControlUnauthorizedError(alice, DEPOSIT_LIMIT_SET_ROLE));
         vm.prank(alice);
         stSpk.setDepositLimit(1_000_000e18);
     }
@@ -101,14 +87,7 @@ contract SetDepositLimitSuccessTests is BaseTest {
 contract SetDepositWhitelistFailureTests is BaseTest {
 
     function test_setDepositWhitelist_notRole() public {
-        bytes32 depositWhitelistSetRole = keccak256("DEPOSIT_WHITELIST_SET_ROLE");
-        vm.expectRevert(
-            abi.encodeWithSignature(
-                "AccessControlUnauthorizedAccount(address,bytes32)",
-                alice,
-                depositWhitelistSetRole
-            )
-        );
+        vm.expectRevert(_accessControlUnauthorizedError(alice, DEPOSIT_WHITELIST_SET_ROLE));
         vm.prank(alice);
         stSpk.setDepositWhitelist(true);
     }
@@ -147,14 +126,7 @@ contract SetDepositWhitelistSuccessTests is BaseTest {
 contract SetDepositorWhitelistStatusFailureTests is BaseTest {
 
     function test_setDepositorWhitelistStatus_notRole() public {
-        bytes32 depositorWhitelistSetRole = keccak256("DEPOSITOR_WHITELIST_ROLE");
-        vm.expectRevert(
-            abi.encodeWithSignature(
-                "AccessControlUnauthorizedAccount(address,bytes32)",
-                alice,
-                depositorWhitelistSetRole
-            )
-        );
+        vm.expectRevert(_accessControlUnauthorizedError(alice, DEPOSITOR_WHITELIST_ROLE));
         vm.prank(alice);
         stSpk.setDepositorWhitelistStatus(alice, true);
     }
@@ -206,9 +178,7 @@ contract SetDepositorWhitelistStatusSuccessTests is BaseTest {
 contract BurnerRouterSetGlobalReceiverFailureTests is BaseTest {
 
     function test_setGlobalReceiver_notRole() public {
-        vm.expectRevert(
-            abi.encodeWithSignature("OwnableUnauthorizedAccount(address)", alice)
-        );
+        vm.expectRevert(_ownableUnauthorizedError(alice));
         vm.prank(alice);
         burnerRouter.setGlobalReceiver(alice);
     }
@@ -323,9 +293,7 @@ contract BurnerRouterOwnershipTest is BaseTest {
 contract BurnerRouterSetDelayFailureTests is BaseTest {
 
     function test_setDelay_notRole() public {
-        vm.expectRevert(
-            abi.encodeWithSignature("OwnableUnauthorizedAccount(address)", alice)
-        );
+        vm.expectRevert(_ownableUnauthorizedError(alice));
         vm.prank(alice);
         burnerRouter.setDelay(15 days);
     }
@@ -433,9 +401,7 @@ contract BurnerRouterAcceptDelaySuccessTests is BaseTest {
 contract BurnerRouterSetNetworkReceiverFailureTests is BaseTest {
 
     function test_setNetworkReceiver_notRole() public {
-        vm.expectRevert(
-            abi.encodeWithSignature("OwnableUnauthorizedAccount(address)", alice)
-        );
+        vm.expectRevert(_ownableUnauthorizedError(alice));
         vm.prank(alice);
         burnerRouter.setNetworkReceiver(makeAddr("network"), alice);
     }
@@ -533,9 +499,7 @@ contract BurnerRouterAcceptNetworkReceiverSuccessTests is BaseTest {
 contract BurnerRouterSetOperatorNetworkReceiverFailureTests is BaseTest {
 
     function test_setOperatorNetworkReceiver_notRole() public {
-        vm.expectRevert(
-            abi.encodeWithSignature("OwnableUnauthorizedAccount(address)", alice)
-        );
+        vm.expectRevert(_ownableUnauthorizedError(alice));
         vm.prank(alice);
         burnerRouter.setOperatorNetworkReceiver(makeAddr("network"), makeAddr("operator"), alice);
     }
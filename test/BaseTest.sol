@@ -4,15 +4,13 @@ pragma solidity 0.8.25;
 import "forge-std/Test.sol";
 
 // Import Symbiotic interfaces
-import "../lib/burners/src/interfaces/router/IBurnerRouter.sol";
-import "../lib/core/src/interfaces/vault/IVault.sol";
-import "../lib/core/src/interfaces/vault/IVaultTokenized.sol";
+import { IBurnerRouter }   from "../lib/burners/src/interfaces/router/IBurnerRouter.sol";
+import { IVaultTokenized } from "../lib/core/src/interfaces/vault/IVaultTokenized.sol";
 
 // Import OpenZeppelin interfaces
-import "@openzeppelin/contracts/access/IAccessControl.sol";
-import "@openzeppelin/contracts/token/ERC20/extensions/IERC20Metadata.sol";
-import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
-import "@openzeppelin/contracts-upgradeable/access/OwnableUpgradeable.sol";
+import { IAccessControl }     from "@openzeppelin/contracts/access/IAccessControl.sol";
+import { IERC20Metadata }     from "@openzeppelin/contracts/token/ERC20/extensions/IERC20Metadata.sol";
+import { OwnableUpgradeable } from "@openzeppelin/contracts-upgradeable/access/OwnableUpgradeable.sol";
 
 import { INetworkMiddlewareService } from "../lib/core/src/interfaces/service/INetworkMiddlewareService.sol";
 import { INetworkRegistry }          from "../lib/core/src/interfaces/INetworkRegistry.sol";
@@ -50,6 +48,8 @@ abstract contract BaseTest is Test {
     address constant OWNER     = SPARK_GOVERNANCE;
     address constant OPERATOR  = SPARK_GOVERNANCE;
 
+    bytes32 constant SUBNETWORK = bytes32(uint256(uint160(NETWORK)) << 96 | 0);  // Subnetwork.subnetwork(network, 0)
+
     // Token
     address constant SPK = 0xc20059e0317DE91738d13af027DfC4a50781b066;
 
@@ -58,9 +58,18 @@ abstract contract BaseTest is Test {
     uint48 constant EPOCH_DURATION        = 2 weeks;
     uint48 constant SLASHER_VETO_DURATION = 3 days;
 
-    // Roles
+    // Roles (AccessControl role identifiers are keccak256 of the role name)
     bytes32 constant DEFAULT_ADMIN_ROLE = 0x00;
 
+    bytes32 constant DEPOSIT_WHITELIST_SET_ROLE = keccak256("DEPOSIT_WHITELIST_SET_ROLE");
+    bytes32 constant DEPOSITOR_WHITELIST_ROLE   = keccak256("DEPOSITOR_WHITELIST_ROLE");
+    bytes32 constant IS_DEPOSIT_LIMIT_SET_ROLE  = keccak256("IS_DEPOSIT_LIMIT_SET_ROLE");
+    bytes32 constant DEPOSIT_LIMIT_SET_ROLE     = keccak256("DEPOSIT_LIMIT_SET_ROLE");
+
+    bytes32 constant HOOK_SET_ROLE                    = keccak256("HOOK_SET_ROLE");
+    bytes32 constant NETWORK_LIMIT_SET_ROLE           = keccak256("NETWORK_LIMIT_SET_ROLE");
+    bytes32 constant OPERATOR_NETWORK_SHARES_SET_ROLE = keccak256("OPERATOR_NETWORK_SHARES_SET_ROLE");
+
     bytes32 constant ADMIN_SLOT = 0xb53127684a568b3173ae13b9f8a6016e243e63b6e8ee1178d6a717850b5d6103;
 
     // Constants based on forked state
@@ -86,8 +95,6 @@ abstract contract BaseTest is Test {
 
     INetworkMiddlewareService middlewareService;
 
-    bytes32 public subnetwork;
-
     /**********************************************************************************************/
     /*** Setup                                                                                  ***/
     /**********************************************************************************************/
@@ -101,12 +108,11 @@ abstract contract BaseTest is Test {
 
         middlewareService = INetworkMiddlewareService(slasher.NETWORK_MIDDLEWARE_SERVICE());
 
-        subnetwork = bytes32(uint256(uint160(NETWORK)) << 96 | 0);  // Subnetwork.subnetwork(network, 0)
-
         _setupTestUsers();
 
         _transferOwnershipToGovernance();
-        _testOwnershipTransfer();
+        // NOTE: The resulting ownership/role state is asserted once in OwnershipTransferTest
+        //       rather than on every test's setUp.
 
         /******************************************************************************************/
         /*** Do Spark Governance configuration                                                  ***/
@@ -123,17 +129,17 @@ abstract contract BaseTest is Test {
         // --- Step 2: Configure the network and operator to take control of 2m SPK stake as the vault owner
 
         vm.startPrank(OWNER);
-        delegator.setNetworkLimit(subnetwork, type(uint256).max);
+        delegator.setNetworkLimit(SUBNETWORK, type(uint256).max);
         delegator.setOperatorNetworkShares(
-            subnetwork,
+            SUBNETWORK,
             OPERATOR,
             1e18  // 100% shares
         );
         delegator.setHook(RESET_HOOK);
-        IAccessControl(address(delegator)).grantRole(delegator.OPERATOR_NETWORK_SHARES_SET_ROLE(), RESET_HOOK);
+        IAccessControl(address(delegator)).grantRole(OPERATOR_NETWORK_SHARES_SET_ROLE, RESET_HOOK);
         vm.stopPrank();
 
-        assertEq(delegator.totalOperatorNetworkSharesAt(subnetwork, uint48(block.timestamp), ""), 1e18);
+        assertEq(delegator.totalOperatorNetworkSharesAt(SUBNETWORK, uint48(block.timestamp), ""), 1e18);
 
         // --- Step 3: Opt in to the vault as the operator
 
@@ -149,7 +155,7 @@ abstract contract BaseTest is Test {
         assertEq(TOTAL_STAKE,  330_427_794.295338751923090149e18);
         assertEq(SPK_BALANCE,  331_725_538.538237804754740626e18);
 
-        assertEq(delegator.stake(subnetwork, OPERATOR), ACTIVE_STAKE);
+        assertEq(delegator.stake(SUBNETWORK, OPERATOR), ACTIVE_STAKE);
     }
 
     function _setupTestUsers() internal {
@@ -171,27 +177,27 @@ abstract contract BaseTest is Test {
         assertEq(OwnableUpgradeable(address(stSpk)).owner(), SPARK_CONTROLLED_MULTISIG);
         OwnableUpgradeable(address(stSpk)).transferOwnership(SPARK_GOVERNANCE);
 
-        stSpk.renounceRole(stSpk.DEPOSIT_WHITELIST_SET_ROLE(), SPARK_CONTROLLED_MULTISIG);
-        stSpk.renounceRole(stSpk.DEPOSITOR_WHITELIST_ROLE(),   SPARK_CONTROLLED_MULTISIG);
-        stSpk.renounceRole(stSpk.IS_DEPOSIT_LIMIT_SET_ROLE(),  SPARK_CONTROLLED_MULTISIG);
-        stSpk.renounceRole(stSpk.DEPOSIT_LIMIT_SET_ROLE(),     SPARK_CONTROLLED_MULTISIG);
+        stSpk.renounceRole(DEPOSIT_WHITELIST_SET_ROLE, SPARK_CONTROLLED_MULTISIG);
+        stSpk.renounceRole(DEPOSITOR_WHITELIST_ROLE,   SPARK_CONTROLLED_MULTISIG);
+        stSpk.renounceRole(IS_DEPOSIT_LIMIT_SET_ROLE,  SPARK_CONTROLLED_MULTISIG);
+        stSpk.renounceRole(DEPOSIT_LIMIT_SET_ROLE,     SPARK_CONTROLLED_MULTISIG);
 
-        stSpk.grantRole(stSpk.DEPOSIT_WHITELIST_SET_ROLE(), SPARK_GOVERNANCE);
-        stSpk.grantRole(stSpk.DEPOSITOR_WHITELIST_ROLE(),   SPARK_GOVERNANCE);
-        stSpk.grantRole(stSpk.IS_DEPOSIT_LIMIT_SET_ROLE(),  SPARK_GOVERNANCE);
-        stSpk.grantRole(stSpk.DEPOSIT_LIMIT_SET_ROLE(),     SPARK_GOVERNANCE);
+        stSpk.grantRole(DEPOSIT_WHITELIST_SET_ROLE, SPARK_GOVERNANCE);
+        stSpk.grantRole(DEPOSITOR_WHITELIST_ROLE,   SPARK_GOVERNANCE);
+        stSpk.grantRole(IS_DEPOSIT_LIMIT_SET_ROLE,  SPARK_GOVERNANCE);
+        stSpk.grantRole(DEPOSIT_LIMIT_SET_ROLE,     SPARK_GOVERNANCE);
 
         stSpk.grantRole(DEFAULT_ADMIN_ROLE,    SPARK_GOVERNANCE);
         stSpk.renounceRole(DEFAULT_ADMIN_ROLE, SPARK_CONTROLLED_MULTISIG);
 
         // 3. Delegator
-        delegator.renounceRole(delegator.HOOK_SET_ROLE(),                    SPARK_CONTROLLED_MULTISIG);
-        delegator.renounceRole(delegator.NETWORK_LIMIT_SET_ROLE(),           SPARK_CONTROLLED_MULTISIG);
-        delegator.renounceRole(delegator.OPERATOR_NETWORK_SHARES_SET_ROLE(), SPARK_CONTROLLED_MULTISIG);
+        delegator.renounceRole(HOOK_SET_ROLE,                    SPARK_CONTROLLED_MULTISIG);
+        delegator.renounceRole(NETWORK_LIMIT_SET_ROLE,           SPARK_CONTROLLED_MULTISIG);
+        delegator.renounceRole(OPERATOR_NETWORK_SHARES_SET_ROLE, SPARK_CONTROLLED_MULTISIG);
 
-        delegator.grantRole(delegator.HOOK_SET_ROLE(),                    SPARK_GOVERNANCE);
-        delegator.grantRole(delegator.NETWORK_LIMIT_SET_ROLE(),           SPARK_GOVERNANCE);
-        delegator.grantRole(delegator.OPERATOR_NETWORK_SHARES_SET_ROLE(), SPARK_GOVERNANCE);
+        delegator.grantRole(HOOK_SET_ROLE,                    SPARK_GOVERNANCE);
+        delegator.grantRole(NETWORK_LIMIT_SET_ROLE,           SPARK_GOVERNANCE);
+        delegator.grantRole(OPERATOR_NETWORK_SHARES_SET_ROLE, SPARK_GOVERNANCE);
 
         delegator.grantRole(DEFAULT_ADMIN_ROLE, SPARK_GOVERNANCE);
         delegator.renounceRole(DEFAULT_ADMIN_ROLE, SPARK_CONTROLLED_MULTISIG);
@@ -222,15 +228,15 @@ abstract contract BaseTest is Test {
         assertEq(admin, VAULT_FACTORY);
 
         // Correct roles
-        assertTrue(stSpk.hasRole(stSpk.DEPOSIT_WHITELIST_SET_ROLE(), SPARK_GOVERNANCE));
-        assertTrue(stSpk.hasRole(stSpk.DEPOSITOR_WHITELIST_ROLE(),   SPARK_GOVERNANCE));
-        assertTrue(stSpk.hasRole(stSpk.IS_DEPOSIT_LIMIT_SET_ROLE(),  SPARK_GOVERNANCE));
-        assertTrue(stSpk.hasRole(stSpk.DEPOSIT_LIMIT_SET_ROLE(),     SPARK_GOVERNANCE));
+        assertTrue(stSpk.hasRole(DEPOSIT_WHITELIST_SET_ROLE, SPARK_GOVERNANCE));
+        assertTrue(stSpk.hasRole(DEPOSITOR_WHITELIST_ROLE,   SPARK_GOVERNANCE));
+        assertTrue(stSpk.hasRole(IS_DEPOSIT_LIMIT_SET_ROLE,  SPARK_GOVERNANCE));
+        assertTrue(stSpk.hasRole(DEPOSIT_LIMIT_SET_ROLE,     SPARK_GOVERNANCE));
 
-        assertFalse(stSpk.hasRole(stSpk.DEPOSIT_WHITELIST_SET_ROLE(), SPARK_CONTROLLED_MULTISIG));
-        assertFalse(stSpk.hasRole(stSpk.DEPOSITOR_WHITELIST_ROLE(),   SPARK_CONTROLLED_MULTISIG));
-        assertFalse(stSpk.hasRole(stSpk.IS_DEPOSIT_LIMIT_SET_ROLE(),  SPARK_CONTROLLED_MULTISIG));
-        assertFalse(stSpk.hasRole(stSpk.DEPOSIT_LIMIT_SET_ROLE(),     SPARK_CONTROLLED_MULTISIG));
+        assertFalse(stSpk.hasRole(DEPOSIT_WHITELIST_SET_ROLE, SPARK_CONTROLLED_MULTISIG));
+        assertFalse(stSpk.hasRole(DEPOSITOR_WHITELIST_ROLE,   SPARK_CONTROLLED_MULTISIG));
+        assertFalse(stSpk.hasRole(IS_DEPOSIT_LIMIT_SET_ROLE,  SPARK_CONTROLLED_MULTISIG));
+        assertFalse(stSpk.hasRole(DEPOSIT_LIMIT_SET_ROLE,     SPARK_CONTROLLED_MULTISIG));
 
         assertTrue(stSpk.hasRole(DEFAULT_ADMIN_ROLE,  SPARK_GOVERNANCE));
         assertFalse(stSpk.hasRole(DEFAULT_ADMIN_ROLE, SPARK_CONTROLLED_MULTISIG));
@@ -248,13 +254,13 @@ abstract contract BaseTest is Test {
         assertEq(vm.load(address(delegator), ADMIN_SLOT), bytes32(0));
 
         // Correct roles
-        assertTrue(delegator.hasRole(delegator.HOOK_SET_ROLE(),                    SPARK_GOVERNANCE));
-        assertTrue(delegator.hasRole(delegator.NETWORK_LIMIT_SET_ROLE(),           SPARK_GOVERNANCE));
-        assertTrue(delegator.hasRole(delegator.OPERATOR_NETWORK_SHARES_SET_ROLE(), SPARK_GOVERNANCE));
+        assertTrue(delegator.hasRole(HOOK_SET_ROLE,                    SPARK_GOVERNANCE));
+        assertTrue(delegator.hasRole(NETWORK_LIMIT_SET_ROLE,           SPARK_GOVERNANCE));
+        assertTrue(delegator.hasRole(OPERATOR_NETWORK_SHARES_SET_ROLE, SPARK_GOVERNANCE));
 
-        assertFalse(delegator.hasRole(delegator.HOOK_SET_ROLE(),                    SPARK_CONTROLLED_MULTISIG));
-        assertFalse(delegator.hasRole(delegator.NETWORK_LIMIT_SET_ROLE(),           SPARK_CONTROLLED_MULTISIG));
-        assertFalse(delegator.hasRole(delegator.OPERATOR_NETWORK_SHARES_SET_ROLE(), SPARK_CONTROLLED_MULTISIG));
+        assertFalse(delegator.hasRole(HOOK_SET_ROLE,                    SPARK_CONTROLLED_MULTISIG));
+        assertFalse(delegator.hasRole(NETWORK_LIMIT_SET_ROLE,           SPARK_CONTROLLED_MULTISIG));
+        assertFalse(delegator.hasRole(OPERATOR_NETWORK_SHARES_SET_ROLE, SPARK_CONTROLLED_MULTISIG));
 
         assertTrue(delegator.hasRole(DEFAULT_ADMIN_ROLE,  SPARK_GOVERNANCE));
         assertFalse(delegator.hasRole(DEFAULT_ADMIN_ROLE, SPARK_CONTROLLED_MULTISIG));
@@ -280,6 +286,18 @@ abstract contract BaseTest is Test {
     /*** Helper functions                                                                       ***/
     /**********************************************************************************************/
 
+    /**
+     * @notice Helper function to approve and deposit SPK into the vault as a user
+     * @param user Depositing user
+     * @param amount Amount of SPK to deposit
+     */
+    function _deposit(address user, uint256 amount) internal {
+        vm.startPrank(user);
+        spk.approve(address(stSpk), amount);
+        stSpk.deposit(user, amount);
+        vm.stopPrank();
+    }
+
     /**
      * @notice Helper function to calculate absolute difference between two numbers
      * @param a First number
@@ -290,4 +308,23 @@ abstract contract BaseTest is Test {
         return a >= b ? a - b : b - a;
     }
 
+    /**
+     * @notice Helper function to encode the AccessControl unauthorized-account error
+     * @param account Account missing the role
+     * @param role Required role
+     * @return Encoded revert data
+     */
+    function _accessControlUnauthorizedError(address account, bytes32 role) internal pure returns (bytes memory) {
+        return abi.encodeWithSignature("AccessControlUnauthorizedAccount(address,bytes32)", account, role);
+    }
+
+    /**
+     * @notice Helper function to encode the Ownable unauthorized-account error
+     * @param account Account that is not the owner
+     * @return Encoded revert data
+     */
+    function _ownableUnauthorizedError(address account) internal pure returns (bytes memory) {
+        return abi.encodeWithSignature("OwnableUnauthorizedAccount(address)", account);
+    }
+
 }
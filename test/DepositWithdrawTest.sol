@@ -67,10 +67,7 @@ contract TestDepositFailureTests is BaseTest {
         stSpk.setDepositLimit(depositLimit);
 
         // Alice deposits up to the limit
-        vm.startPrank(alice);
-        spk.approve(address(stSpk), 1000e18);
-        stSpk.deposit(alice, 1000e18);
-        vm.stopPrank();
+        _deposit(alice, 1000e18);
 
         // Alice tries to deposit 1 wei more (should fail)
         vm.startPrank(alice);
@@ -148,10 +145,7 @@ contract TestDepositSuccessTests is BaseTest {
         // Test stake-related functions
         uint256 depositAmount = 1000e18;
 
-        vm.startPrank(alice);
-        spk.approve(address(stSpk), depositAmount);
-        stSpk.deposit(alice, depositAmount);
-        vm.stopPrank();
+        _deposit(alice, depositAmount);
 
         // Check total stake
         uint256 totalStake = stSpk.totalStake();
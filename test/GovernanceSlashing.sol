@@ -7,23 +7,22 @@ interface INetworkDelegator is IAccessControl {}
 
 contract GovernanceSlashingTest is BaseTest {
 
+    // Deposit amounts shared by the slashing scenarios below
+    uint256 constant ALICE_DEPOSIT = 6_000_000e18;
+    uint256 constant BOB_DEPOSIT   = 4_000_000e18;
+    uint256 constant TOTAL_DEPOSIT = ALICE_DEPOSIT + BOB_DEPOSIT;  // 10m SPK
+
     address MIDDLEWARE = makeAddr("middleware");
 
     function test_slashingIsDisabledUnlessMiddlewareIsSet() public {
         // --- Step 1: Deposit 10m SPK to stSPK as two users
 
-        deal(address(spk), alice, 6_000_000e18);
-        deal(address(spk), bob,   4_000_000e18);
+        deal(address(spk), alice, ALICE_DEPOSIT);
+        deal(address(spk), bob,   BOB_DEPOSIT);
 
-        vm.startPrank(alice);
-        spk.approve(address(stSpk), 6_000_000e18);
-        stSpk.deposit(alice, 6_000_000e18);
-        vm.stopPrank();
+        _deposit(alice, ALICE_DEPOSIT);
 
-        vm.startPrank(bob);
-        spk.approve(address(stSpk), 4_000_000e18);
-        stSpk.deposit(bob, 4_000_000e18);
-        vm.stopPrank();
+        _deposit(bob, BOB_DEPOSIT);
 
         uint48 depositTimestamp = uint48(block.timestamp);
 
@@ -34,16 +33,16 @@ contract GovernanceSlashingTest is BaseTest {
         uint48 captureTimestamp = uint48(block.timestamp - 1 seconds);  // Can't capture current timestamp and above
 
         // Demonstrate that the slashable stake increases with new deposits
-        assertEq(slasher.slashableStake(subnetwork, OPERATOR, depositTimestamp - 1, ""), 0);
-        assertEq(slasher.slashableStake(subnetwork, OPERATOR, depositTimestamp,     ""), ACTIVE_STAKE + 10_000_000e18);
-        assertEq(slasher.slashableStake(subnetwork, OPERATOR, captureTimestamp,     ""), ACTIVE_STAKE + 10_000_000e18);
+        assertEq(slasher.slashableStake(SUBNETWORK, OPERATOR, depositTimestamp - 1, ""), 0);
+        assertEq(slasher.slashableStake(SUBNETWORK, OPERATOR, depositTimestamp,     ""), ACTIVE_STAKE + TOTAL_DEPOSIT);
+        assertEq(slasher.slashableStake(SUBNETWORK, OPERATOR, captureTimestamp,     ""), ACTIVE_STAKE + TOTAL_DEPOSIT);
 
         // There is no middleware, so slashing is impossible
         assertEq(middlewareService.middleware(NETWORK), address(0));
 
         vm.prank(NETWORK);
         vm.expectRevert("NotNetworkMiddleware()");
-        slasher.requestSlash(subnetwork, OPERATOR, 10_000_000e18, captureTimestamp, "");
+        slasher.requestSlash(SUBNETWORK, OPERATOR, TOTAL_DEPOSIT, captureTimestamp, "");
 
         // Show how it would work if middleware was set
         vm.prank(NETWORK);
@@ -53,9 +52,9 @@ contract GovernanceSlashingTest is BaseTest {
         assertEq(middlewareService.middleware(NETWORK), MIDDLEWARE);
 
         vm.prank(MIDDLEWARE);
-        uint256 slashIndex = slasher.requestSlash(subnetwork, OPERATOR, 10_000_000e18, captureTimestamp, "");
+        uint256 slashIndex = slasher.requestSlash(SUBNETWORK, OPERATOR, TOTAL_DEPOSIT, captureTimestamp, "");
 
-        skip(3 days + 1);
+        skip(SLASHER_VETO_DURATION + 1);
 
         vm.prank(MIDDLEWARE);
         slasher.executeSlash(slashIndex, "");
@@ -70,18 +69,12 @@ contract GovernanceSlashingTest is BaseTest {
 
         // --- Step 1: Deposit 10m SPK to stSPK as two users
 
-        deal(address(spk), alice, 6_000_000e18);
-        deal(address(spk), bob,   4_000_000e18);
+        deal(address(spk), alice, ALICE_DEPOSIT);
+        deal(address(spk), bob,   BOB_DEPOSIT);
 
-        vm.startPrank(alice);
-        spk.approve(address(stSpk), 6_000_000e18);
-        stSpk.deposit(alice, 6_000_000e18);
-        vm.stopPrank();
+        _deposit(alice, ALICE_DEPOSIT);
 
-        vm.startPrank(bob);
-        spk.approve(address(stSpk), 4_000_000e18);
-        stSpk.deposit(bob, 4_000_000e18);
-        vm.stopPrank();
+        _deposit(bob, BOB_DEPOSIT);
 
         uint48 depositTimestamp = uint48(block.timestamp);
 
@@ -92,15 +85,15 @@ contract GovernanceSlashingTest is BaseTest {
         uint48 captureTimestamp = uint48(block.timestamp - 1 seconds);  // Can't capture current timestamp and above
 
         uint256 slashAmount    = 100_000_000_000e18;  // Slash above active stake to show that only staked funds can be slashed
-        uint256 slashableStake = ACTIVE_STAKE + 10_000_000e18;  // Includes new deposits
+        uint256 slashableStake = ACTIVE_STAKE + TOTAL_DEPOSIT;  // Includes new deposits
 
         // Demonstrate that the slashable stake increases with new deposits (these are the first deposits made after new config setup)
-        assertEq(slasher.slashableStake(subnetwork, OPERATOR, depositTimestamp - 1, ""), 0);
-        assertEq(slasher.slashableStake(subnetwork, OPERATOR, depositTimestamp,     ""), slashableStake);  // Entire stake is slashable
-        assertEq(slasher.slashableStake(subnetwork, OPERATOR, captureTimestamp,     ""), slashableStake);
+        assertEq(slasher.slashableStake(SUBNETWORK, OPERATOR, depositTimestamp - 1, ""), 0);
+        assertEq(slasher.slashableStake(SUBNETWORK, OPERATOR, depositTimestamp,     ""), slashableStake);  // Entire stake is slashable
+        assertEq(slasher.slashableStake(SUBNETWORK, OPERATOR, captureTimestamp,     ""), slashableStake);
 
         vm.prank(MIDDLEWARE);
-        uint256 slashIndex = slasher.requestSlash(subnetwork, OPERATOR, slashAmount, captureTimestamp, "");
+        uint256 slashIndex = slasher.requestSlash(SUBNETWORK, OPERATOR, slashAmount, captureTimestamp, "");
 
         assertEq(slasher.slashRequestsLength(), 1);
 
@@ -111,53 +104,61 @@ contract GovernanceSlashingTest is BaseTest {
 
         // --- Step 3: Fast-forward past veto window and execute the slash
 
-        skip(3 days + 1);
+        skip(SLASHER_VETO_DURATION + 1);
 
         // Overwrite totalStake because of epochs possibly changing from warp
         TOTAL_STAKE = stSpk.totalStake();
 
-        assertEq(stSpk.activeBalanceOf(alice), 6_000_000e18);
-        assertEq(stSpk.activeBalanceOf(bob),   4_000_000e18);
+        assertEq(stSpk.activeBalanceOf(alice), ALICE_DEPOSIT);
+        assertEq(stSpk.activeBalanceOf(bob),   BOB_DEPOSIT);
         assertEq(stSpk.totalStake(),           TOTAL_STAKE);  // 10m captured in above query
 
-        assertEq(slasher.slashableStake(subnetwork, OPERATOR, captureTimestamp, ""), slashableStake);
+        assertEq(slasher.slashableStake(SUBNETWORK, OPERATOR, captureTimestamp, ""), slashableStake);
 
-        assertEq(spk.balanceOf(address(stSpk)), SPK_BALANCE + 10_000_000e18);
+        assertEq(spk.balanceOf(address(stSpk)), SPK_BALANCE + TOTAL_DEPOSIT);
         assertEq(spk.balanceOf(BURNER_ROUTER),  0);
 
-        assertEq(slasher.latestSlashedCaptureTimestamp(subnetwork, OPERATOR), 0);
-        assertEq(slasher.cumulativeSlash(subnetwork, OPERATOR),               0);
+        assertEq(slasher.latestSlashedCaptureTimestamp(SUBNETWORK, OPERATOR), 0);
+        assertEq(slasher.cumulativeSlash(SUBNETWORK, OPERATOR),               0);
 
-        assertEq(delegator.operatorNetworkShares(subnetwork, OPERATOR), 1e18);
+        assertEq(delegator.operatorNetworkShares(SUBNETWORK, OPERATOR), 1e18);
 
         vm.prank(MIDDLEWARE);
         slasher.executeSlash(slashIndex, "");
 
-        assertEq(delegator.operatorNetworkShares(subnetwork, OPERATOR), 0);
+        assertEq(delegator.operatorNetworkShares(SUBNETWORK, OPERATOR), 0);
+
+        // Bind the post-slash vault state once instead of re-querying it per assertion
+        uint256 activeStake  = stSpk.activeStake();
+        uint256 activeShares = stSpk.activeShares();
+        uint256 totalStake   = stSpk.totalStake();
+
+        uint256 aliceActiveBalance = stSpk.activeBalanceOf(alice);
+        uint256 bobActiveBalance   = stSpk.activeBalanceOf(bob);
 
         // Show that active stake is reduced proportionally with withdrawals
         assertApproxEqAbs(
-            stSpk.activeStake(),
-            slashableStake - slashableStake * stSpk.activeStake() / stSpk.totalStake(),
+            activeStake,
+            slashableStake - slashableStake * activeStake / totalStake,
             10
         );
 
         // Show that active balance is reduced proportionally with withdrawals
-        assertEq(stSpk.activeBalanceOf(alice), 6_000_000e18 * stSpk.activeStake() / stSpk.activeShares());
-        assertEq(stSpk.activeBalanceOf(bob),   4_000_000e18 * stSpk.activeStake() / stSpk.activeShares());
+        assertEq(aliceActiveBalance, ALICE_DEPOSIT * activeStake / activeShares);
+        assertEq(bobActiveBalance,   BOB_DEPOSIT * activeStake / activeShares);
 
-        assertEq(stSpk.activeBalanceOf(alice), 529_471.960385890527024221e18);
-        assertEq(stSpk.activeBalanceOf(bob),   352_981.306923927018016147e18);
+        assertEq(aliceActiveBalance, 529_471.960385890527024221e18);
+        assertEq(bobActiveBalance,   352_981.306923927018016147e18);
 
-        assertEq(stSpk.totalStake(), TOTAL_STAKE - slashableStake);
+        assertEq(totalStake, TOTAL_STAKE - slashableStake);
 
-        assertEq(slasher.slashableStake(subnetwork, OPERATOR, captureTimestamp, ""), 0);
+        assertEq(slasher.slashableStake(SUBNETWORK, OPERATOR, captureTimestamp, ""), 0);
 
-        assertEq(spk.balanceOf(address(stSpk)), SPK_BALANCE + 10_000_000e18 - slashableStake);
+        assertEq(spk.balanceOf(address(stSpk)), SPK_BALANCE + TOTAL_DEPOSIT - slashableStake);
         assertEq(spk.balanceOf(BURNER_ROUTER),  slashableStake);
 
-        assertEq(slasher.latestSlashedCaptureTimestamp(subnetwork, OPERATOR), captureTimestamp);
-        assertEq(slasher.cumulativeSlash(subnetwork, OPERATOR),               slashableStake);
+        assertEq(slasher.latestSlashedCaptureTimestamp(SUBNETWORK, OPERATOR), captureTimestamp);
+        assertEq(slasher.cumulativeSlash(SUBNETWORK, OPERATOR),               slashableStake);
 
         ( ,, amount,,, completed ) = slasher.slashRequests(slashIndex);
 
@@ -183,23 +184,23 @@ contract GovernanceSlashingTest is BaseTest {
 
         // --- Step 6: Show that slasher also cannot request new slashes because the network limit has been hit
 
-        assertEq(slasher.slashableStake(subnetwork, OPERATOR, captureTimestamp, ""), 0);
+        assertEq(slasher.slashableStake(SUBNETWORK, OPERATOR, captureTimestamp, ""), 0);
 
         // Try to slash from the same capture timestamp that was already slashed
         vm.prank(MIDDLEWARE);
         vm.expectRevert("InsufficientSlash()");
-        slashIndex = slasher.requestSlash(subnetwork, OPERATOR, 100e18, captureTimestamp, "");  // Use the same capture timestamp
+        slashIndex = slasher.requestSlash(SUBNETWORK, OPERATOR, 100e18, captureTimestamp, "");  // Use the same capture timestamp
 
         // --- Step 7: Demonstrate that the slashable stake never increases again
 
         skip(100 days);
 
-        assertEq(slasher.slashableStake(subnetwork, OPERATOR, uint48(block.timestamp - 1), ""), 0);
+        assertEq(slasher.slashableStake(SUBNETWORK, OPERATOR, uint48(block.timestamp - 1), ""), 0);
 
         // Try to slash from a new capture timestamp that is long after the last slash was completed
         vm.prank(MIDDLEWARE);
         vm.expectRevert("InsufficientSlash()");
-        slasher.requestSlash(subnetwork, OPERATOR, 100e18, uint48(block.timestamp - 1), "");  // Use the same capture timestamp
+        slasher.requestSlash(SUBNETWORK, OPERATOR, 100e18, uint48(block.timestamp - 1), "");  // Use the same capture timestamp
     }
 
     function test_ownerMultisigCanVetoSlash_withMiddlewareConfigured() public {
@@ -209,18 +210,12 @@ contract GovernanceSlashingTest is BaseTest {
 
         // --- Step 1: Deposit 10m SPK to stSPK as two users
 
-        deal(address(spk), alice, 6_000_000e18);
-        deal(address(spk), bob,   4_000_000e18);
+        deal(address(spk), alice, ALICE_DEPOSIT);
+        deal(address(spk), bob,   BOB_DEPOSIT);
 
-        vm.startPrank(alice);
-        spk.approve(address(stSpk), 6_000_000e18);
-        stSpk.deposit(alice, 6_000_000e18);
-        vm.stopPrank();
+        _deposit(alice, ALICE_DEPOSIT);
 
-        vm.startPrank(bob);
-        spk.approve(address(stSpk), 4_000_000e18);
-        stSpk.deposit(bob, 4_000_000e18);
-        vm.stopPrank();
+        _deposit(bob, BOB_DEPOSIT);
 
         skip(24 hours);  // Warp 24 hours
 
@@ -229,25 +224,25 @@ contract GovernanceSlashingTest is BaseTest {
         uint48 captureTimestamp = uint48(block.timestamp - 1 hours);
 
         vm.prank(MIDDLEWARE);
-        uint256 slashIndex = slasher.requestSlash(subnetwork, OPERATOR, 10_000_000e18, captureTimestamp, "");
+        uint256 slashIndex = slasher.requestSlash(SUBNETWORK, OPERATOR, TOTAL_DEPOSIT, captureTimestamp, "");
 
         assertEq(slasher.slashRequestsLength(), 1);
 
         ( ,, uint256 amount,,, bool completed ) = slasher.slashRequests(slashIndex);
 
-        assertEq(amount,    10_000_000e18);  // Can't request to slash more than the network limit (requested full 10m)
+        assertEq(amount,    TOTAL_DEPOSIT);  // Can't request to slash more than the network limit (requested full 10m)
         assertEq(completed, false);
 
         // --- Step 3: Owner multisig vetos the slash request
 
-        skip(3 days - 1 seconds);  // Demonstrate multisig has a full three days from request to veto
+        skip(SLASHER_VETO_DURATION - 1 seconds);  // Demonstrate multisig has a full three days from request to veto
 
         vm.prank(SPARK_GOVERNANCE);
         slasher.vetoSlash(slashIndex, "");
 
         ( ,, amount,,, completed ) = slasher.slashRequests(slashIndex);
 
-        assertEq(amount,    10_000_000e18);
+        assertEq(amount,    TOTAL_DEPOSIT);
         assertEq(completed, true);  // Prevents execution of the slash
 
         // --- Step 4: Attempt to execute the slashing after veto (should fail)
@@ -195,10 +195,7 @@ contract IntegrationTest is BaseTest {
 
         // All users deposit
         for (uint256 i = 0; i < users.length; i++) {
-            vm.startPrank(users[i]);
-            spk.approve(address(stSpk), depositAmounts[i]);
-            stSpk.deposit(users[i], depositAmounts[i]);
-            vm.stopPrank();
+            _deposit(users[i], depositAmounts[i]);
         }
 
         // Record initial total stake
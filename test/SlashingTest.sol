@@ -2,7 +2,6 @@
 pragma solidity 0.8.25;
 
 import "./BaseTest.sol";
-import "../lib/core/src/interfaces/slasher/IVetoSlasher.sol";
 
 // NOTE: All of these tests are skipped because the configuration does not allow for slashing since the middleware is not set
 
@@ -13,7 +12,7 @@ contract SlashingTest is BaseTest {
     function test_cannotSlash() public {
         vm.startPrank(NETWORK);
         vm.expectRevert("NotNetworkMiddleware()");
-        slasher.requestSlash(subnetwork, OPERATOR, 1, uint48(block.timestamp - 1), "");
+        slasher.requestSlash(SUBNETWORK, OPERATOR, 1, uint48(block.timestamp - 1), "");
     }
 
     function skip_test_unauthorizedCannotCallOnSlash() public {
@@ -24,9 +23,9 @@ contract SlashingTest is BaseTest {
 
     function _doSlash(uint256 slashAmount, uint48 captureTimestamp) internal returns (uint256 slashedAmount) {
         vm.startPrank(NETWORK);
-        uint256 slashIndex = slasher.requestSlash(subnetwork, OPERATOR, slashAmount, captureTimestamp, "");
+        uint256 slashIndex = slasher.requestSlash(SUBNETWORK, OPERATOR, slashAmount, captureTimestamp, "");
 
-        skip(3 days + 1);  // Warp past veto window
+        skip(SLASHER_VETO_DURATION + 1);  // Warp past veto window
 
         slashedAmount = slasher.executeSlash(slashIndex, "");
 
@@ -35,10 +34,7 @@ contract SlashingTest is BaseTest {
 
     function skip_test_onlySlasherCanSlash() public {
         uint256 depositAmount = 5000e18;
-        vm.startPrank(alice);
-        spk.approve(address(stSpk), depositAmount);
-        stSpk.deposit(alice, depositAmount);
-        vm.stopPrank();
+        _deposit(alice, depositAmount);
 
         skip(1 seconds);
 
@@ -84,10 +80,7 @@ contract SlashingTest is BaseTest {
     function skip_test_realSlashingScenario() public {
         // Setup: Alice deposits into stSpk
         uint256 depositAmount = 10000e18; // 10k SPK
-        vm.startPrank(alice);
-        spk.approve(address(stSpk), depositAmount);
-        stSpk.deposit(alice, depositAmount);
-        vm.stopPrank();
+        _deposit(alice, depositAmount);
 
         skip(1 seconds);
 
@@ -123,10 +116,7 @@ contract SlashingTest is BaseTest {
     function skip_test_slashingAccessControl() public {
         // Give Alice some tokens to deposit so slashing has an effect
         uint256 depositAmount = 2000e18;
-        vm.startPrank(alice);
-        spk.approve(address(stSpk), depositAmount);
-        stSpk.deposit(alice, depositAmount);
-        vm.stopPrank();
+        _deposit(alice, depositAmount);
 
         skip(1 seconds);
 
@@ -236,16 +226,16 @@ contract SlashingTest is BaseTest {
     function skip_test_slashingWithZeroAmount() public {
         vm.startPrank(NETWORK);
         vm.expectRevert("InsufficientSlash()");
-        slasher.requestSlash(subnetwork, OPERATOR, 0, uint48(block.timestamp - 1), "");
+        slasher.requestSlash(SUBNETWORK, OPERATOR, 0, uint48(block.timestamp - 1), "");
     }
 
     function skip_test_slashingWithCurrentOrFutureTimestamp() public {
         vm.startPrank(NETWORK);
         vm.expectRevert("InvalidCaptureTimestamp()");
-        slasher.requestSlash(subnetwork, OPERATOR, 0, uint48(block.timestamp), "");
+        slasher.requestSlash(SUBNETWORK, OPERATOR, 0, uint48(block.timestamp), "");
 
         vm.expectRevert("InvalidCaptureTimestamp()");
-        slasher.requestSlash(subnetwork, OPERATOR, 0, uint48(block.timestamp + 1), "");
+        slasher.requestSlash(SUBNETWORK, OPERATOR, 0, uint48(block.timestamp + 1), "");
     }
 
     // TODO: Refactor this
@@ -254,10 +244,7 @@ contract SlashingTest is BaseTest {
 
         // Setup: Alice deposits into stSpk
         uint256 depositAmount = 10000e18; // 10k SPK
-        vm.startPrank(alice);
-        spk.approve(address(stSpk), depositAmount);
-        stSpk.deposit(alice, depositAmount);
-        vm.stopPrank();
+        _deposit(alice, depositAmount);
 
         skip(1 seconds);
 
@@ -485,16 +472,10 @@ contract SlashingTest is BaseTest {
         uint256 bobDeposit   = 4000e18;  // 4k SPK
 
         // Alice deposits
-        vm.startPrank(alice);
-        spk.approve(address(stSpk), aliceDeposit);
-        stSpk.deposit(alice, aliceDeposit);
-        vm.stopPrank();
+        _deposit(alice, aliceDeposit);
 
         // Bob deposits
-        vm.startPrank(bob);
-        spk.approve(address(stSpk), bobDeposit);
-        stSpk.deposit(bob, bobDeposit);
-        vm.stopPrank();
+        _deposit(bob, bobDeposit);
 
         skip(1 seconds);
 
@@ -537,16 +518,10 @@ contract SlashingTest is BaseTest {
         uint256 bobDeposit   = 7000e18;    // 7k SPK
 
         // Alice deposits
-        vm.startPrank(alice);
-        spk.approve(address(stSpk), aliceDeposit);
-        stSpk.deposit(alice, aliceDeposit);
-        vm.stopPrank();
+        _deposit(alice, aliceDeposit);
 
         // Bob deposits
-        vm.startPrank(bob);
-        spk.approve(address(stSpk), bobDeposit);
-        stSpk.deposit(bob, bobDeposit);
-        vm.stopPrank();
+        _deposit(bob, bobDeposit);
 
         skip(1 seconds);
 
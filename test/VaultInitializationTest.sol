@@ -25,20 +25,11 @@ contract VaultInitializationTest is BaseTest {
 
     function test_AdminRoles() public view {
         // Test that Spark Governance has all required admin roles
-        // Use the standard OpenZeppelin DEFAULT_ADMIN_ROLE constant
-        bytes32 defaultAdminRole = 0x00; // DEFAULT_ADMIN_ROLE is bytes32(0)
-
-        // Define role constants based on OpenZeppelin AccessControl pattern
-        bytes32 depositWhitelistSetRole = keccak256("DEPOSIT_WHITELIST_SET_ROLE");
-        bytes32 depositorWhitelistRole  = keccak256("DEPOSITOR_WHITELIST_ROLE");
-        bytes32 isDepositLimitSetRole   = keccak256("IS_DEPOSIT_LIMIT_SET_ROLE");
-        bytes32 depositLimitSetRole     = keccak256("DEPOSIT_LIMIT_SET_ROLE");
-
-        assertTrue(stSpk.hasRole(defaultAdminRole,        SPARK_GOVERNANCE), "Missing DEFAULT_ADMIN_ROLE");
-        assertTrue(stSpk.hasRole(depositWhitelistSetRole, SPARK_GOVERNANCE), "Missing DEPOSIT_WHITELIST_SET_ROLE");
-        assertTrue(stSpk.hasRole(depositorWhitelistRole,  SPARK_GOVERNANCE), "Missing DEPOSITOR_WHITELIST_ROLE");
-        assertTrue(stSpk.hasRole(isDepositLimitSetRole,   SPARK_GOVERNANCE), "Missing IS_DEPOSIT_LIMIT_SET_ROLE");
-        assertTrue(stSpk.hasRole(depositLimitSetRole,     SPARK_GOVERNANCE), "Missing DEPOSIT_LIMIT_SET_ROLE");
+        assertTrue(stSpk.hasRole(DEFAULT_ADMIN_ROLE,         SPARK_GOVERNANCE), "Missing DEFAULT_ADMIN_ROLE");
+        assertTrue(stSpk.hasRole(DEPOSIT_WHITELIST_SET_ROLE, SPARK_GOVERNANCE), "Missing DEPOSIT_WHITELIST_SET_ROLE");
+        assertTrue(stSpk.hasRole(DEPOSITOR_WHITELIST_ROLE,   SPARK_GOVERNANCE), "Missing DEPOSITOR_WHITELIST_ROLE");
+        assertTrue(stSpk.hasRole(IS_DEPOSIT_LIMIT_SET_ROLE,  SPARK_GOVERNANCE), "Missing IS_DEPOSIT_LIMIT_SET_ROLE");
+        assertTrue(stSpk.hasRole(DEPOSIT_LIMIT_SET_ROLE,     SPARK_GOVERNANCE), "Missing DEPOSIT_LIMIT_SET_ROLE");
     }
 
     function test_DelegatorAndSlasherAlreadySet() public view {
@@ -132,16 +123,17 @@ contract VaultInitializationTest is BaseTest {
         INetworkDelegator networkDelegator = INetworkDelegator(NETWORK_DELEGATOR);
 
         // Test that Spark Governance has all required admin roles
-        // Use the standard OpenZeppelin DEFAULT_ADMIN_ROLE constant
-        bytes32 defaultAdminRole = 0x00; // DEFAULT_ADMIN_ROLE is bytes32(0)
+        assertTrue(networkDelegator.hasRole(DEFAULT_ADMIN_ROLE,               SPARK_GOVERNANCE), "Missing DEFAULT_ADMIN_ROLE");
+        assertTrue(networkDelegator.hasRole(NETWORK_LIMIT_SET_ROLE,           SPARK_GOVERNANCE), "Missing NETWORK_LIMIT_SET_ROLE");
+        assertTrue(networkDelegator.hasRole(OPERATOR_NETWORK_SHARES_SET_ROLE, SPARK_GOVERNANCE), "Missing OPERATOR_NETWORK_SHARES_SET_ROLE");
+    }
+
+}
 
-        // Define role constants based on OpenZeppelin AccessControl pattern
-        bytes32 setNetworkLimitRole          = keccak256("NETWORK_LIMIT_SET_ROLE");
-        bytes32 setOperatorNetworkSharesRole = keccak256("OPERATOR_NETWORK_SHARES_SET_ROLE");
+contract OwnershipTransferTest is BaseTest {
 
-        assertTrue(networkDelegator.hasRole(defaultAdminRole,             SPARK_GOVERNANCE), "Missing DEFAULT_ADMIN_ROLE");
-        assertTrue(networkDelegator.hasRole(setNetworkLimitRole,          SPARK_GOVERNANCE), "Missing NETWORK_LIMIT_SET_ROLE");
-        assertTrue(networkDelegator.hasRole(setOperatorNetworkSharesRole, SPARK_GOVERNANCE), "Missing OPERATOR_NETWORK_SHARES_SET_ROLE");
+    function test_ownershipTransfer() public {
+        _testOwnershipTransfer();
     }
 
 }
@@ -180,10 +172,6 @@ contract NetworkDelegatorDeploymentEventsTest is EventsTest {
     bytes32 private constant SET_NETWORK_LIMIT_SIG     = keccak256("SetNetworkLimit(bytes32,uint256)");
     bytes32 private constant SET_OPERATOR_SHARES_SIG   = keccak256("SetOperatorNetworkShares(bytes32,address,uint256)");
 
-    bytes32 private constant HOOK_SET_ROLE                    = keccak256("HOOK_SET_ROLE");
-    bytes32 private constant NETWORK_LIMIT_SET_ROLE           = keccak256("NETWORK_LIMIT_SET_ROLE");
-    bytes32 private constant OPERATOR_NETWORK_SHARES_SET_ROLE = keccak256("OPERATOR_NETWORK_SHARES_SET_ROLE");
-
     function test_networkDelegatorEventsInHistory() public {
         // fetch *all* logs from deploymentBlock → latest
         VmSafe.EthGetLogs[] memory allLogs = vm.eth_getLogs(
@@ -267,11 +255,6 @@ contract StakedSPKVaultDeploymentEventsTest is EventsTest {
     bytes32 private constant UPGRADED_SIG              = keccak256("Upgraded(address)");
     bytes32 private constant WITHDRAW_SIG              = keccak256("Withdraw(address,address,uint256,uint256,uint256)");
 
-    bytes32 private constant DEPOSIT_LIMIT_SET_ROLE     = keccak256("DEPOSIT_LIMIT_SET_ROLE");
-    bytes32 private constant DEPOSIT_WHITELIST_SET_ROLE = keccak256("DEPOSIT_WHITELIST_SET_ROLE");
-    bytes32 private constant DEPOSITOR_WHITELIST_ROLE   = keccak256("DEPOSITOR_WHITELIST_ROLE");
-    bytes32 private constant IS_DEPOSIT_LIMIT_SET_ROLE  = keccak256("IS_DEPOSIT_LIMIT_SET_ROLE");
-
     function test_spkVaultEventsInHistory() public {
         // fetch *all* logs from deploymentBlock → latest
         VmSafe.EthGetLogs[] memory allLogs = vm.eth_getLogs(
@@ -299,45 +282,25 @@ contract StakedSPKVaultDeploymentEventsTest is EventsTest {
 
         _assertLogs(allLogs[1], ownershipTransferredTopics);
 
-        bytes32[] memory roleGrantedTopics1 = new bytes32[](4);
-        roleGrantedTopics1[0] = ROLE_GRANTED_SIG;
-        roleGrantedTopics1[1] = DEFAULT_ADMIN_ROLE;
-        roleGrantedTopics1[2] = multisig;
-        roleGrantedTopics1[3] = vaultFactory;
-
-        _assertLogs(allLogs[2], roleGrantedTopics1);
-
-        bytes32[] memory roleGrantedTopics2 = new bytes32[](4);
-        roleGrantedTopics2[0] = ROLE_GRANTED_SIG;
-        roleGrantedTopics2[1] = DEPOSIT_WHITELIST_SET_ROLE;
-        roleGrantedTopics2[2] = multisig;
-        roleGrantedTopics2[3] = vaultFactory;
-
-        _assertLogs(allLogs[3], roleGrantedTopics2);
-
-        bytes32[] memory roleGrantedTopics3 = new bytes32[](4);
-        roleGrantedTopics3[0] = ROLE_GRANTED_SIG;
-        roleGrantedTopics3[1] = DEPOSITOR_WHITELIST_ROLE;
-        roleGrantedTopics3[2] = multisig;
-        roleGrantedTopics3[3] = vaultFactory;
+        bytes32[] memory roleGrantedTopics = new bytes32[](4);
+        roleGrantedTopics[0] = ROLE_GRANTED_SIG;
+        roleGrantedTopics[1] = DEFAULT_ADMIN_ROLE;
+        roleGrantedTopics[2] = multisig;
+        roleGrantedTopics[3] = vaultFactory;
 
-        _assertLogs(allLogs[4], roleGrantedTopics3);
+        _assertLogs(allLogs[2], roleGrantedTopics);
 
-        bytes32[] memory roleGrantedTopics4 = new bytes32[](4);
-        roleGrantedTopics4[0] = ROLE_GRANTED_SIG;
-        roleGrantedTopics4[1] = IS_DEPOSIT_LIMIT_SET_ROLE;
-        roleGrantedTopics4[2] = multisig;
-        roleGrantedTopics4[3] = vaultFactory;
+        roleGrantedTopics[1] = DEPOSIT_WHITELIST_SET_ROLE;
+        _assertLogs(allLogs[3], roleGrantedTopics);
 
-        _assertLogs(allLogs[5], roleGrantedTopics4);
+        roleGrantedTopics[1] = DEPOSITOR_WHITELIST_ROLE;
+        _assertLogs(allLogs[4], roleGrantedTopics);
 
-        bytes32[] memory roleGrantedTopics5 = new bytes32[](4);
-        roleGrantedTopics5[0] = ROLE_GRANTED_SIG;
-        roleGrantedTopics5[1] = DEPOSIT_LIMIT_SET_ROLE;
-        roleGrantedTopics5[2] = multisig;
-        roleGrantedTopics5[3] = vaultFactory;
+        roleGrantedTopics[1] = IS_DEPOSIT_LIMIT_SET_ROLE;
+        _assertLogs(allLogs[5], roleGrantedTopics);
 
-        _assertLogs(allLogs[6], roleGrantedTopics5);
+        roleGrantedTopics[1] = DEPOSIT_LIMIT_SET_ROLE;
+        _assertLogs(allLogs[6], roleGrantedTopics);
 
         assertEq(allLogs[7].topics[0],     INITIALIZED_SIG);
         assertEq(allLogs[7].topics.length, 1);